@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 
 import numpy as np
 from PIL import Image
@@ -32,10 +33,12 @@ def _add_grid(
         arr: Numpy array whose last 3 dimensions are spatial (x, y) and channel (c).
         spacing: Spacing to be applied. Must be a divisor of the array spatial dims.
         thickness: Thickness of the grid line.
-        color: Color of the grid line. White is 1, black is 0.
+        color: Color of the grid line. White is 1 (or 255 for uint8 arrays), black
+            is 0.
 
     Returns:
-        An array with modified spatial dimensions.
+        An array with modified spatial dimensions, or the array itself if the
+        thickness is 0.
     """
     *s, x, y, c = arr.shape
     sx, sy = _ensure_tuple(spacing)
@@ -44,27 +47,29 @@ def _add_grid(
     if x % sx != 0 or y % sy != 0:
         raise ValueError(f"{x} (resp {y}) should be divisible by {sx} (resp {sy}).")
 
-    arr = arr.reshape(tuple(s) + (x // sx, sx, y // sy, sy, c))
+    if (tx, ty) == (0, 0):
+        return arr
 
-    # Add the internal grid, including the trailing vertical and horizontal lines.
-    pad_width = [(0, 0) for i in range(arr.ndim)]
-    pad_width[-4] = (0, tx)
-    pad_width[-2] = (0, ty)
-    pad_width = tuple(pad_width)
-    arr = np.pad(arr, pad_width, mode="constant", constant_values=color)
+    nx, ny = x // sx, y // sy
 
-    arr = arr.reshape(tuple(s) + ((x // sx) * (sx + tx), (y // sy) * (sy + ty), c))
-
-    # Add the missing leading vertical and horizontal lines.
-    pad_width = [(0, 0) for i in range(arr.ndim)]
-    pad_width[-3] = (tx, 0)
-    pad_width[-2] = (ty, 0)
-    pad_width = tuple(pad_width)
-    arr = np.pad(arr, pad_width, mode="constant", constant_values=color)
+    # Fill a canvas with the grid color and copy the cells in between the lines.
+    out = np.full(
+        tuple(s) + (nx * (sx + tx) + tx, ny * (sy + ty) + ty, c),
+        color,
+        dtype=arr.dtype,
+    )
+    if (sx, sy) == (1, 1):
+        # Each pixel is its own cell, so a strided slice selects all of them.
+        out[..., tx :: 1 + tx, ty :: 1 + ty, :] = arr
+    else:
+        cells = out[..., tx:, ty:, :]
+        cells = cells.reshape(tuple(s) + (nx, sx + tx, ny, sy + ty, c))
+        cells[..., :sx, :, :sy, :] = arr.reshape(tuple(s) + (nx, sx, ny, sy, c))
 
-    return arr
+    return out
 
 
+@lru_cache(maxsize=256)
 def _guess_spatial_channel_dims(shape: tuple[int, ...]) -> tuple[tuple[int], int]:
     """Guesses the spatial and channel dimensions of an array shape.
 
@@ -98,6 +103,94 @@ def _guess_spatial_channel_dims(shape: tuple[int, ...]) -> tuple[tuple[int], int
     return spatial_dims, channel_dim
 
 
+def _has_out_of_range_values(arr: np.ndarray, max_range: int) -> bool:
+    """Checks whether an array has values outside of the [0:max_range] range.
+
+    Bounds already guaranteed by an integer dtype (like 0 and 255 for uint8) are
+    not checked, which avoids full scans of the array.
+
+    Args:
+        arr: Array of floats or integers.
+        max_range: Maximum allowed value.
+
+    Returns:
+        True if at least one value is lower than 0 or greater than `max_range`.
+    """
+    if np.issubdtype(arr.dtype, np.integer):
+        dtype_info = np.iinfo(arr.dtype)
+        check_min, check_max = dtype_info.min < 0, dtype_info.max > max_range
+    else:
+        check_min, check_max = True, True
+
+    return bool((check_min and arr.min() < 0) or (check_max and arr.max() > max_range))
+
+
+def _scale_values(arr: np.ndarray, norm: bool, inverted_colors: bool) -> np.ndarray:
+    """Scales the values of an array to floats between 0 and 1.
+
+    Args:
+        arr: Array of floats between 0 and 1 or integers between 0 and 255.
+        norm: If True, normalize values with a min-max normalization.
+        inverted_colors: If True, inverts the scaled values.
+
+    Returns:
+        A float32 array with values between 0 and 1.
+    """
+    if np.issubdtype(arr.dtype, np.integer):
+        # Integers are divided by 255 as part of the transform below.
+        max_range = 255
+    elif np.issubdtype(arr.dtype, np.floating):
+        max_range = 1
+    else:
+        raise TypeError(
+            "The array values should be either floats between 0 and 1, or integers "
+            "between 0 and 255."
+        )
+
+    # Values are mapped to [0:1] with `(arr - offset) / span`, which folds the
+    # normalization and the color inversion into a single affine transform.
+    offset, span, clip = 0, max_range, False
+
+    if norm:
+        min_val = arr.min()
+        max_val = arr.max()
+        offset, span = min_val, float(max_val) - float(min_val)
+        if inverted_colors:
+            offset, span = max_val, -span
+
+    else:
+        if _has_out_of_range_values(arr, max_range):
+            logging.warning(
+                "Clipping values not in the [0:1] range. "
+                "You may want to use the `norm=True` argument."
+            )
+            clip = True
+        if inverted_colors:
+            offset, span = max_range, -span
+
+    if offset != 0 or span != 1:
+        # The first operation allocates the working array, the next ones are in place.
+        # The offset is removed at the input precision, after which single precision
+        # is enough for values that end up as uint8 pixels.
+        out = np.empty(arr.shape, np.float32)
+        if offset != 0:
+            arr = np.subtract(arr, float(offset), out=out, casting="same_kind")
+            if span != 1:
+                arr /= span
+        else:
+            arr = np.divide(arr, span, out=out, casting="same_kind")
+        if clip:
+            np.clip(arr, 0.0, 1.0, out=arr)
+    elif clip:
+        out = np.empty(arr.shape, np.float32)
+        arr = np.clip(arr, 0.0, 1.0, out=out, casting="same_kind")
+    else:
+        # Values are already between 0 and 1 and only need a conversion.
+        arr = arr.astype(np.float32, order="C", copy=False)
+
+    return arr
+
+
 def array_to_image(
     arr,
     spatial_dims: tuple[int, ...] | None = None,
@@ -146,31 +239,7 @@ def array_to_image(
             By default, it is 0 for the last 2D dimensions and 2 pixels for the others.
         norm: If True, normalize values between 0 and 1 with a min-max normalization.
     """
-    arr = np.asarray(arr)
-
-    if np.issubdtype(arr.dtype, np.integer):
-        arr = arr / 255
-
-    if not np.issubdtype(arr.dtype, np.floating):
-        raise TypeError(
-            "The array values should be either floats between 0 and 1, or integers "
-            "between 0 and 255."
-        )
-
-    if norm:
-        min_val = arr.min()
-        max_val = arr.max()
-        arr = (arr - min_val) / (max_val - min_val)
-
-    elif arr.min() < 0 or arr.max() > 1:
-        logging.warning(
-            "Clipping values not in the [0:1] range. "
-            "You may want to use the `norm=True` argument."
-        )
-        arr = np.clip(arr, 0.0, 1.0)
-
-    if inverted_colors:
-        arr = 1 - arr
+    arr = input_arr = np.asarray(arr)
 
     # Try to guess the spatial and channel dim to represent the data
     if spatial_dims is None or channel_dim is None:
@@ -186,6 +255,17 @@ def array_to_image(
             f"Possible values: 1, 2 or 3"
         )
 
+    if arr.dtype == np.uint8 and cmap is None and not norm and channel_dim != 2:
+        # uint8 values are already pixel values: skip the conversion to floats.
+        if inverted_colors:
+            arr = np.subtract(np.uint8(255), arr, order="C")
+    else:
+        arr = _scale_values(arr, norm, inverted_colors)
+
+    # Transposed or sliced inputs are copied once here rather than by each of
+    # the following reshapes.
+    arr = np.ascontiguousarray(arr)
+
     # Force a 3D array with 2 spatial dimensions and 1 channel dimension
     arr = arr.reshape(spatial_dims + (channel_dim,))
     # assert len(arr.shape) == 3
@@ -211,7 +291,10 @@ def array_to_image(
 
     elif cmap is None and channel_dim == 2:
         # Add a third channel filled with 1s and consider those values as HSV values.
-        arr = np.concatenate((arr, np.ones(spatial_dims + (1,))), axis=-1)
+        hsv = np.empty(spatial_dims + (3,), dtype=arr.dtype)
+        hsv[..., :2] = arr
+        hsv[..., 2] = 1.0
+        arr = hsv
 
     if bin_size is None:
         # Try to guess a convenient scale_factor
@@ -224,38 +307,68 @@ def array_to_image(
     if bin_size != (1, 1):
         # Rescale each value to a bin of bin_size[0]*bin_size[1] pixels.
         *s, x, y, c = arr.shape
+        # Broadcasting gives a zero-stride view that is copied only once.
         arr = arr.reshape(tuple(s) + (x, 1, y, 1, c))
-        arr = arr * np.ones(tuple(s) + (x, bin_size[0], y, bin_size[1], c))
+        arr = np.broadcast_to(arr, tuple(s) + (x, bin_size[0], y, bin_size[1], c))
+        arr = np.ascontiguousarray(arr)
         arr = arr.reshape(tuple(s) + (x * bin_size[0], y * bin_size[1], c))
 
     # Set default grid thicknesses for all levels if not provided
     grid_thickness = (
         [grid_thickness] if isinstance(grid_thickness, int) else list(grid_thickness)
     )
+    # An empty tuple falls back to the default thicknesses
+    grid_thickness = grid_thickness or [0]
 
-    while len(grid_thickness) < len(spatial_dims) // 2:
-        grid_thickness.insert(0, max(2, grid_thickness[0]))
+    n_missing = len(spatial_dims) // 2 - len(grid_thickness)
+    if n_missing > 0:
+        outer_thickness = max(2, grid_thickness[0])
+        grid_thickness = [outer_thickness] * n_missing + grid_thickness
+
+    # Grid lines are white, whether the array holds floats or uint8 values
+    grid_color = 255 if arr.dtype == np.uint8 else 1.0
 
     if (thickness := grid_thickness.pop()) != 0:
-        arr = _add_grid(arr, bin_size, thickness)
+        arr = _add_grid(arr, bin_size, thickness, grid_color)
 
     # If array has more than 3 spatial dimensions, iterate to make images of images
     while len(arr.shape) >= 5:
+        if not any(grid_thickness):
+            # Without grids left, tile all the remaining levels with a single copy.
+            *s, c = arr.shape
+            axes = tuple(range(0, len(s), 2)) + tuple(range(1, len(s), 2))
+            arr = arr.transpose(axes + (len(s),))
+            arr = arr.reshape((int(np.prod(s[::2])), int(np.prod(s[1::2])), c))
+            break
+
         *s, xx, yy, x, y, c = arr.shape
 
         arr = arr.swapaxes(-4, -3)
         arr = arr.reshape(tuple(s) + (xx * x, yy * y, c))
 
         if (thickness := grid_thickness.pop()) != 0:
-            arr = _add_grid(arr, (x, y), thickness)
+            arr = _add_grid(arr, (x, y), thickness, grid_color)
 
-    # Return the corresponding PIL image
+    if arr.dtype != np.uint8:
+        # Casting the product on the fly avoids a full float temporary.
+        arr = np.multiply(arr, 255, out=np.empty(arr.shape, np.uint8), casting="unsafe")
+
+    # Return the corresponding PIL image, built directly from the contiguous buffer
     match arr.shape[-1]:
         case 1:
-            return Image.fromarray(np.uint8(arr.squeeze(axis=-1) * 255), "L")
+            mode = "L"
         case 3:
-            return Image.fromarray(np.uint8(arr * 255), "RGB")
+            mode = "RGB"
         case 4:
-            return Image.fromarray(np.uint8(arr * 255), "RGBA")
+            mode = "RGBA"
         case _:
             raise ValueError(f"{arr.shape=}")
+
+    # Image.frombuffer shares memory with `arr` (for "L" and "RGBA" modes), so the
+    # buffer is copied if it is not contiguous or if it is still the caller's array,
+    # which happens for uint8 inputs that went through unchanged.
+    if not arr.flags.c_contiguous or np.shares_memory(arr, input_arr):
+        arr = np.array(arr, order="C")
+
+    size = (arr.shape[-2], arr.shape[-3])
+    return Image.frombuffer(mode, size, arr, "raw", mode, 0, 1)
@@ -8,7 +8,12 @@ Todo:
 # ruff: noqa: D103
 
 import numpy as np
-from array2image.core import _add_grid, _guess_spatial_channel_dims, array_to_image
+from array2image.core import (
+    _add_grid,
+    _guess_spatial_channel_dims,
+    _has_out_of_range_values,
+    array_to_image,
+)
 
 
 def test_guess_spatial_channel_dimensions():
@@ -34,3 +39,118 @@ def test_array_to_image():
 def test_add_grid():
     array = np.ones((10, 10, 1))
     _add_grid(array, spacing=1, thickness=1)
+
+
+def test_add_grid_layout():
+    array = np.zeros((4, 6, 1))
+    grid = _add_grid(array, spacing=(2, 3), thickness=1)
+    assert grid.shape == (7, 9, 1)
+    assert np.all(grid[[0, 3, 6], :, 0] == 1.0)
+    assert np.all(grid[:, [0, 4, 8], 0] == 1.0)
+    assert grid.sum() == 7 * 9 - 4 * 6
+
+    grid = _add_grid(array, spacing=1, thickness=(1, 2))
+    assert grid.shape == (9, 20, 1)
+    assert np.all(grid[::2, :, 0] == 1.0)
+    assert grid.sum() == 9 * 20 - 4 * 6
+
+
+def test_array_to_image_uint8():
+    array = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    image = array_to_image(array, bin_size=1)
+    assert np.array_equal(np.asarray(image), array)
+
+    image = array_to_image(array, bin_size=1, inverted_colors=True)
+    assert np.array_equal(np.asarray(image), 255 - array)
+
+
+def test_array_to_image_norm_signed_integers():
+    array = np.array([[[-32768], [0]], [[1], [32767]]], dtype=np.int16)
+    image = array_to_image(array, bin_size=1, norm=True)
+    assert np.array_equal(np.asarray(image), [[0, 127], [127, 255]])
+
+    array = np.array([[[-(2**31)], [2**31 - 1]]], dtype=np.int32)
+    image = array_to_image(array, bin_size=1, norm=True)
+    assert np.array_equal(np.asarray(image), [[0, 255]])
+
+
+def test_array_to_image_norm_large_offset():
+    array = (10**9 + np.arange(256)).reshape(16, 16, 1)
+    image = array_to_image(array, bin_size=1, norm=True)
+    assert len(np.unique(np.asarray(image))) > 200
+
+    array = (1e4 + np.linspace(0, 1e-2, 256)).reshape(16, 16, 1)
+    image = array_to_image(array, bin_size=1, norm=True)
+    assert len(np.unique(np.asarray(image))) > 100
+
+
+def test_array_to_image_does_not_share_input():
+    array = np.zeros((8, 8), dtype=np.uint8)
+    image = array_to_image(array, bin_size=1)
+    array[...] = 200
+    assert image.getpixel((0, 0)) == 0
+
+    array = np.zeros((8, 8, 3), dtype=np.uint8)
+    image = array_to_image(array, bin_size=1)
+    array[...] = 200
+    assert image.getpixel((0, 0)) == (0, 0, 0)
+
+    array = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    image = array_to_image(array.T, bin_size=1)
+    assert np.array_equal(np.asarray(image), array.T)
+
+
+def test_array_to_image_tiling():
+    array = np.random.default_rng(0).integers(0, 256, (2, 3, 4, 5, 6, 7), np.uint8)
+    image = array_to_image(array, bin_size=1, grid_thickness=(0, 0, 0))
+    expected = array.transpose(0, 2, 4, 1, 3, 5).reshape(2 * 4 * 6, 3 * 5 * 7)
+    assert np.array_equal(np.asarray(image), expected)
+
+
+def test_add_grid_no_thickness():
+    array = np.ones((10, 10, 1))
+    assert _add_grid(array, spacing=2, thickness=0) is array
+
+
+class _NoScanArray(np.ndarray):
+    def min(self, *args, **kwargs):
+        raise AssertionError("min() should not be called")
+
+    def max(self, *args, **kwargs):
+        raise AssertionError("max() should not be called")
+
+
+def test_has_out_of_range_values(caplog):
+    array = np.arange(256, dtype=np.uint8).view(_NoScanArray)
+    assert not _has_out_of_range_values(array, 255)
+
+    array = np.array([0, 300], dtype=np.uint16)
+    assert _has_out_of_range_values(array, 255)
+    assert not _has_out_of_range_values(array[:1], 255)
+
+    array = np.array([-1, 0], dtype=np.int8)
+    assert _has_out_of_range_values(array, 255)
+
+    array = np.array([0, 2**20], dtype=np.int64)
+    assert _has_out_of_range_values(array, 255)
+
+    assert _has_out_of_range_values(np.array([0.0, 1.5]), 1)
+    assert not _has_out_of_range_values(np.array([0.0, 1.0]), 1)
+
+    array_to_image(np.array([[-1, 0], [3, 4]], dtype=np.int8).reshape(2, 2, 1))
+    assert "Clipping values" in caplog.text
+    caplog.clear()
+
+    array_to_image(np.array([[0, 2**20]], dtype=np.int64).reshape(1, 2, 1))
+    assert "Clipping values" in caplog.text
+    caplog.clear()
+
+    array_to_image(np.arange(64, dtype=np.uint8).reshape(8, 8))
+    assert "Clipping values" not in caplog.text
+
+
+def test_array_to_image_empty_grid_thickness():
+    array = np.zeros((2, 3, 4, 5))
+    image = array_to_image(array, bin_size=1, grid_thickness=())
+    assert image.size == (3 * (5 + 2) + 2, 2 * (4 + 2) + 2)
+    assert image.tobytes() == array_to_image(array, bin_size=1).tobytes()